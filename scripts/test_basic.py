@@ -58,6 +58,8 @@ def test_digital_root():
         (1, 1),
         (9, 9),
         (10, 1),
+        (18, 9),
+        (2025, 9),
     ]
     
     for year, expected in test_cases:
@@ -75,6 +77,84 @@ def test_digital_root():
     print("✓ All digital root calculations correct")
     return True
 
+def test_url_validation():
+    """Test URL validation edge cases."""
+    print("\nTesting URL validation...")
+    
+    from src.utils.data_validation import DataValidator
+    
+    validator = DataValidator()
+    test_cases = [
+        ("https://en.wikipedia.org/wiki/1929", True),
+        ("http://example.com.", True),
+        ("http://localhost:8000/api", True),
+        ("http://1.2.3.4", True),
+        ("http://1.2.3.4.", False),
+        ("http://12.34.56.78./x", False),
+        ("ftp://example.com", False),
+    ]
+    
+    for url, expected in test_cases:
+        if validator.is_valid_url(url) != expected:
+            print(f"✗ URL validation failed for {url}: expected {expected}")
+            return False
+    
+    print("✓ All URL validation cases correct")
+    return True
+
+def test_log_queue():
+    """Test that the bounded log queue never loses the listener's stop sentinel."""
+    print("\nTesting bounded log queue...")
+    
+    import logging
+    import threading
+    from src.utils.logging_config import _BoundedLogQueue, _BatchingQueueListener
+    
+    def make_record(i):
+        return logging.LogRecord("test", logging.INFO, __file__, 0, f"record {i}", None, None)
+    
+    # A full queue keeps the sentinel even while later records evict older ones
+    log_queue = _BoundedLogQueue(3)
+    for i in range(3):
+        log_queue.put_nowait(make_record(i))
+    log_queue.put_nowait(_BoundedLogQueue._SENTINEL)
+    for i in range(3, 10):
+        log_queue.put_nowait(make_record(i))
+    
+    for _ in range(10):
+        if log_queue.get(timeout=1) is _BoundedLogQueue._SENTINEL:
+            break
+    else:
+        print("✗ Stop sentinel was evicted from a full queue")
+        return False
+    
+    # stop() must return while another thread keeps logging
+    listener = _BatchingQueueListener(_BoundedLogQueue(8), logging.NullHandler())
+    listener.start()
+    producing = threading.Event()
+    producing.set()
+    
+    def produce():
+        i = 0
+        while producing.is_set():
+            listener.queue.put_nowait(make_record(i))
+            i += 1
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    stopper = threading.Thread(target=listener.stop, daemon=True)
+    stopper.start()
+    stopper.join(timeout=5)
+    producing.clear()
+    producer.join(timeout=5)
+    
+    if stopper.is_alive():
+        print("✗ Listener stop() hung under a concurrent producer")
+        return False
+    
+    print("✓ Bounded log queue keeps the stop sentinel")
+    return True
+
 def test_configuration():
     """Test configuration loading."""
     print("\nTesting configuration...")
@@ -142,6 +222,8 @@ async def main():
         test_basic_imports,
         test_configuration,
         test_digital_root,
+        test_url_validation,
+        test_log_queue,
         test_event_creation
     ]
     
@@ -158,7 +240,7 @@ async def main():
         print("✅ All basic tests passed!")
         print("\nThe core modules are working correctly.")
         print("You can now proceed with:")
-        print("1. Install optional dependencies (pip install aiohttp pandas loguru)")
+        print("1. Install optional dependencies (pip install aiohttp pandas)")
         print("2. Set up your .env file with database credentials")  
         print("3. Run: python scripts/init_database.py")
     else:
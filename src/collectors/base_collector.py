@@ -13,6 +13,12 @@ try:
 except ImportError:
     HAS_AIOHTTP = False
     aiohttp = None
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_PYBLOOM = True
+except ImportError:
+    HAS_PYBLOOM = False
+    ScalableBloomFilter = None
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Iterator, Tuple
 from datetime import datetime, timedelta
@@ -53,9 +59,8 @@ class CollectedEvent:
     
     def calculate_digital_root(self, year: int) -> int:
         """Calculate digital root of the year."""
-        while year > 9:
-            year = sum(int(digit) for digit in str(year))
-        return year
+        # Closed form of the repeated digit sum; years 0-9 are their own root
+        return 1 + (year - 1) % 9 if year > 9 else year
     
     def estimate_severity(self) -> int:
         """Estimate event severity based on description and title."""
@@ -109,6 +114,22 @@ class CollectedEvent:
         """Generate unique hash for deduplication."""
         hash_string = f"{self.year}_{self.title}_{self.source}"
         return hashlib.md5(hash_string.encode()).hexdigest()
+    
+    def get_cross_source_key(self) -> bytes:
+        """Generate a source-independent key for cross-source deduplication."""
+        key_string = f"{self.year}|{self.title.lower()}"
+        return hashlib.blake2b(key_string.encode(), digest_size=8).digest()
+
+def create_seen_filter():
+    """
+    Create a per-run membership filter for cross-source deduplication.
+    
+    Uses a scalable Bloom filter when pybloom_live is installed, otherwise
+    an exact set of event keys.
+    """
+    if HAS_PYBLOOM:
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-4)
+    return set()
 
 class RateLimiter:
     """Rate limiter for API requests."""
@@ -260,22 +281,36 @@ class BaseCollector(ABC):
         
         return True
     
-    def save_events_to_database(self, events: List[CollectedEvent]) -> Tuple[int, int]:
+    def save_events_to_database(self, events: List[CollectedEvent], seen_events=None) -> Tuple[int, int]:
         """
         Save collected events to database.
         
+        Args:
+            events: Events to save
+            seen_events: Optional filter shared across collectors (see create_seen_filter);
+                events another source already saved this run are skipped
+        
         Returns:
             Tuple of (saved_count, error_count)
         """
         saved_count = 0
         error_count = 0
+        skipped_count = 0
         
         for event in events:
+            event_key = event.get_cross_source_key() if seen_events is not None else None
+            if event_key is not None and event_key in seen_events:
+                skipped_count += 1
+                continue
+            
             try:
                 if self.validate_event(event):
                     event_data = event.to_dict()
                     self.db_manager.insert_historical_event(event_data)
                     saved_count += 1
+                    # Only a successful insert blocks the event for later sources
+                    if event_key is not None:
+                        seen_events.add(event_key)
                 else:
                     error_count += 1
                     self.logger.log_warning(f"Invalid event skipped: {event.title[:50]}...")
@@ -283,6 +318,9 @@ class BaseCollector(ABC):
                 error_count += 1
                 self.logger.log_warning(f"Error saving event {event.title[:50]}...: {str(e)}")
         
+        if skipped_count:
+            self.logger.logger.info(f"Skipped {skipped_count} events already saved from other sources")
+        
         return saved_count, error_count
     
     def save_to_file(self, events: List[CollectedEvent], filename: str):
@@ -381,7 +419,7 @@ class BaseCollector(ABC):
             self.logger.log_warning(f"Request error for URL {url}: {str(e)}")
             return None
     
-    async def run_collection(self, start_year: int, end_year: int, save_to_db: bool = True, save_to_file: bool = True) -> Dict[str, Any]:
+    async def run_collection(self, start_year: int, end_year: int, save_to_db: bool = True, save_to_file: bool = True, seen_events=None) -> Dict[str, Any]:
         """
         Run the complete data collection process.
         
@@ -390,6 +428,7 @@ class BaseCollector(ABC):
             end_year: Ending year for collection
             save_to_db: Whether to save to database
             save_to_file: Whether to save to file
+            seen_events: Optional filter shared across collectors (see create_seen_filter)
             
         Returns:
             Collection results summary
@@ -411,7 +450,7 @@ class BaseCollector(ABC):
             error_count = 0
             
             if save_to_db:
-                saved_count, error_count = self.save_events_to_database(events)
+                saved_count, error_count = self.save_events_to_database(events, seen_events)
             
             if save_to_file:
                 filename = f"events_{start_year}_{end_year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
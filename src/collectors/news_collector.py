@@ -292,7 +292,7 @@ class NewsCollector(BaseCollector):
         return 'social'  # Default category for news events
 
 # Async convenience function for external use
-async def collect_news_events(start_year: int, end_year: int, save_to_db: bool = True) -> Dict[str, Any]:
+async def collect_news_events(start_year: int, end_year: int, save_to_db: bool = True, seen_events=None) -> Dict[str, Any]:
     """
     Convenient function to collect news events.
     
@@ -300,9 +300,10 @@ async def collect_news_events(start_year: int, end_year: int, save_to_db: bool =
         start_year: Starting year for collection
         end_year: Ending year for collection
         save_to_db: Whether to save to database
+        seen_events: Optional cross-source deduplication filter
         
     Returns:
         Collection results summary
     """
     collector = NewsCollector()
-    return await collector.run_collection(start_year, end_year, save_to_db=save_to_db)
+    return await collector.run_collection(start_year, end_year, save_to_db=save_to_db, seen_events=seen_events)
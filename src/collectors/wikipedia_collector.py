@@ -417,7 +417,7 @@ class WikipediaCollector(BaseCollector):
         return 'political'  # Default category
 
 # Async convenience function for external use
-async def collect_wikipedia_events(start_year: int, end_year: int, save_to_db: bool = True) -> Dict[str, Any]:
+async def collect_wikipedia_events(start_year: int, end_year: int, save_to_db: bool = True, seen_events=None) -> Dict[str, Any]:
     """
     Convenient function to collect Wikipedia events.
     
@@ -425,9 +425,10 @@ async def collect_wikipedia_events(start_year: int, end_year: int, save_to_db: b
         start_year: Starting year for collection
         end_year: Ending year for collection
         save_to_db: Whether to save to database
+        seen_events: Optional cross-source deduplication filter
         
     Returns:
         Collection results summary
     """
     collector = WikipediaCollector()
-    return await collector.run_collection(start_year, end_year, save_to_db=save_to_db)
+    return await collector.run_collection(start_year, end_year, save_to_db=save_to_db, seen_events=seen_events)
@@ -4,12 +4,21 @@ Coordinates collection from all data sources.
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
 
-from .collectors.base_collector import CollectedEvent
+from .collectors.base_collector import CollectedEvent, create_seen_filter
 from .collectors.wikipedia_collector import collect_wikipedia_events
 from .collectors.economic_collector import collect_economic_events
 from .collectors.news_collector import collect_news_events
@@ -20,6 +29,99 @@ from .utils.data_validation import DataValidator
 
 logger = get_logger(__name__)
 
+def _dump_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report to indented JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(report, indent=2, default=str).encode()
+
+@dataclass(slots=True)
+class SourceSummary:
+    """Running totals for a single data source across batches."""
+    events_collected: int = 0
+    events_saved: int = 0
+    errors: int = 0
+    batches: List[Dict[str, Any]] = field(default_factory=list)
+
+# Prior relative event density per era (sources hold far more events for recent years)
+YEAR_DENSITY_PRIORS = {
+    'ancient': 1,        # before 1500
+    'early_modern': 5,   # 1500-1899
+    'modern': 10         # 1900 onwards
+}
+
+def _density_tier(year: int) -> str:
+    """Return the density tier a year belongs to."""
+    if year < 1500:
+        return 'ancient'
+    elif year < 1900:
+        return 'early_modern'
+    return 'modern'
+
+def _tier_last_year(year: int) -> Optional[int]:
+    """Return the last year of the density tier containing year (None for the open-ended tier)."""
+    if year < 1500:
+        return 1499
+    elif year < 1900:
+        return 1899
+    return None
+
+class BatchPlanner:
+    """
+    Plans year batches so that each batch holds a roughly constant number of events.
+    
+    Dense eras get fewer years per batch than sparse ones, and a batch never
+    spans two density tiers. Densities start from YEAR_DENSITY_PRIORS and are
+    corrected from observed events-per-year after the first (warm-up) batch.
+    The caller's batch_size is the maximum years per batch.
+    """
+    
+    def __init__(self, start_year: int, end_year: int, base_batch_size: int):
+        self.next_year = start_year
+        self.end_year = end_year
+        self.base_batch_size = max(1, base_batch_size)
+        self.densities = {tier: float(prior) for tier, prior in YEAR_DENSITY_PRIORS.items()}
+        self.events_per_density_unit = None
+    
+    def next_batch(self) -> Optional[Tuple[int, int]]:
+        """Return the next (start_year, end_year) batch, or None when done."""
+        if self.next_year > self.end_year:
+            return None
+        
+        density = self.densities[_density_tier(self.next_year)]
+        chunk_years = max(1, int(self.base_batch_size // density))
+        batch_end = min(self.next_year + chunk_years - 1, self.end_year)
+        
+        # Stop at the tier boundary so the whole batch is sized for one era
+        tier_last_year = _tier_last_year(self.next_year)
+        if tier_last_year is not None:
+            batch_end = min(batch_end, tier_last_year)
+        
+        batch = (self.next_year, batch_end)
+        self.next_year = batch[1] + 1
+        return batch
+    
+    def record(self, batch_start: int, batch_end: int, events_collected: int):
+        """Feed the observed event count of a batch back into the density estimates."""
+        if events_collected <= 0:
+            return
+        
+        years = batch_end - batch_start + 1
+        tier = _density_tier(batch_start)  # Batches never cross a tier boundary
+        
+        if self.events_per_density_unit is None:
+            # Warm-up: calibrate the event rate of one density unit
+            self.events_per_density_unit = events_collected / (years * self.densities[tier])
+            return
+        
+        observed = events_collected / (years * self.events_per_density_unit)
+        blended = (self.densities[tier] + observed) / 2
+        self.densities[tier] = min(max(blended, 1.0), float(self.base_batch_size))
+
 class DataCollectionOrchestrator:
     """Orchestrates data collection from multiple sources."""
     
@@ -28,6 +130,7 @@ class DataCollectionOrchestrator:
         self.db_manager = get_database_manager()
         self.validator = DataValidator()
         self.collection_results = []
+        self.seen_events = create_seen_filter()
         
         # Data source collectors
         self.collectors = {
@@ -55,19 +158,23 @@ class DataCollectionOrchestrator:
             start_year: Starting year for collection
             end_year: Ending year for collection
             sources: List of sources to collect from (default: all)
-            batch_size: Number of years to process in each batch
+            batch_size: Maximum number of years to process in each batch
+                (dense eras are split into smaller batches)
             save_to_db: Whether to save to database
             validate_data: Whether to validate collected data
             
         Returns:
             Collection summary results
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info(f"Starting data collection for years {start_year}-{end_year}")
         
         # Initialize database if needed
         if save_to_db and not self.db_manager.connected:
-            init_database()
+            await asyncio.to_thread(init_database)
+        
+        # Fresh cross-source deduplication filter for this run
+        self.seen_events = create_seen_filter()
         
         # Determine sources to use
         if sources is None:
@@ -76,14 +183,12 @@ class DataCollectionOrchestrator:
             # Ensure sources are in priority order
             sources = [s for s in self.collection_order if s in sources]
         
-        # Collect data by batches to manage memory and processing
+        # Collect data by density-adjusted batches to manage memory and processing
         total_years = end_year - start_year + 1
-        batches = [
-            (year, min(year + batch_size - 1, end_year))
-            for year in range(start_year, end_year + 1, batch_size)
-        ]
+        planner = BatchPlanner(start_year, end_year, batch_size)
         
         collection_summary = {
+            'started_at': datetime.now().isoformat(),
             'start_year': start_year,
             'end_year': end_year,
             'total_years': total_years,
@@ -97,11 +202,17 @@ class DataCollectionOrchestrator:
             'duration_seconds': 0,
             'success': True
         }
+        results_by_source: Dict[str, SourceSummary] = {}
         
         try:
             # Process each batch
-            for batch_num, (batch_start, batch_end) in enumerate(batches):
-                logger.info(f"Processing batch {batch_num + 1}/{len(batches)}: {batch_start}-{batch_end}")
+            batch = planner.next_batch()
+            while batch is not None:
+                batch_start, batch_end = batch
+                logger.info(
+                    f"Processing batch {collection_summary['batches_processed'] + 1}: {batch_start}-{batch_end} "
+                    f"({batch_start - start_year}/{total_years} years done, {batch_start}-{end_year} remaining)"
+                )
                 
                 batch_results = await self.collect_batch(
                     batch_start, batch_end, sources, save_to_db
@@ -109,35 +220,42 @@ class DataCollectionOrchestrator:
                 
                 # Aggregate results
                 for source, result in batch_results.items():
-                    if source not in collection_summary['results_by_source']:
-                        collection_summary['results_by_source'][source] = {
-                            'events_collected': 0,
-                            'events_saved': 0,
-                            'errors': 0,
-                            'batches': []
-                        }
+                    source_summary = results_by_source.get(source)
+                    if source_summary is None:
+                        source_summary = results_by_source[source] = SourceSummary()
                     
-                    source_summary = collection_summary['results_by_source'][source]
-                    source_summary['events_collected'] += result.get('events_collected', 0)
-                    source_summary['events_saved'] += result.get('events_saved', 0)
-                    source_summary['errors'] += result.get('errors', 0)
-                    source_summary['batches'].append(result)
+                    source_summary.events_collected += result.get('events_collected', 0)
+                    source_summary.events_saved += result.get('events_saved', 0)
+                    source_summary.errors += result.get('errors', 0)
+                    source_summary.batches.append(result)
                 
+                planner.record(
+                    batch_start, batch_end,
+                    sum(result.get('events_collected', 0) for result in batch_results.values())
+                )
                 collection_summary['batches_processed'] += 1
+                batch = planner.next_batch()
             
             # Calculate totals
-            for source_data in collection_summary['results_by_source'].values():
-                collection_summary['total_events_collected'] += source_data['events_collected']
-                collection_summary['total_events_saved'] += source_data['events_saved']
-                collection_summary['total_errors'] += source_data['errors']
+            for source_data in results_by_source.values():
+                collection_summary['total_events_collected'] += source_data.events_collected
+                collection_summary['total_events_saved'] += source_data.events_saved
+                collection_summary['total_errors'] += source_data.errors
+            collection_summary['results_by_source'] = {
+                source: asdict(source_data) for source, source_data in results_by_source.items()
+            }
             
-            # Validate collected data if requested
+            # Validate collected data if requested (nothing to validate if no new rows landed)
             if validate_data and save_to_db:
-                logger.info("Validating collected data...")
-                collection_summary['validation_results'] = self.validator.generate_validation_report()
+                if collection_summary['total_events_saved'] > 0:
+                    logger.info("Validating collected data...")
+                    collection_summary['validation_results'] = self.validator.generate_validation_report()
+                else:
+                    logger.info("Skipping validation: no new events were saved")
+                    collection_summary['validation_results'] = {'skipped': 'no new events'}
             
             # Calculate duration
-            collection_summary['duration_seconds'] = (datetime.now() - start_time).total_seconds()
+            collection_summary['duration_seconds'] = time.perf_counter() - start_time
             
             logger.info(f"Data collection completed successfully in {collection_summary['duration_seconds']:.2f}s")
             logger.info(f"Total events collected: {collection_summary['total_events_collected']}")
@@ -147,7 +265,10 @@ class DataCollectionOrchestrator:
         except Exception as e:
             collection_summary['success'] = False
             collection_summary['error_message'] = str(e)
-            collection_summary['duration_seconds'] = (datetime.now() - start_time).total_seconds()
+            collection_summary['results_by_source'] = {
+                source: asdict(source_data) for source, source_data in results_by_source.items()
+            }
+            collection_summary['duration_seconds'] = time.perf_counter() - start_time
             
             logger.error(f"Data collection failed: {str(e)}")
             return collection_summary
@@ -169,7 +290,7 @@ class DataCollectionOrchestrator:
                     
                     # Run collection for this source
                     result = await self.collectors[source](
-                        start_year, end_year, save_to_db
+                        start_year, end_year, save_to_db, seen_events=self.seen_events
                     )
                     
                     batch_results[source] = result
@@ -273,6 +394,10 @@ class DataCollectionOrchestrator:
             ]
         }
     
+    async def get_collection_statistics_async(self) -> Dict[str, Any]:
+        """Get collection statistics without blocking the event loop."""
+        return await asyncio.to_thread(self.get_collection_statistics)
+    
     def export_collection_report(self, output_file: str) -> Dict[str, Any]:
         """Export comprehensive collection report."""
         report = {
@@ -286,9 +411,8 @@ class DataCollectionOrchestrator:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            f.write(_dump_report(report))
         
         logger.info(f"Collection report exported to {output_path}")
         return report
@@ -2,18 +2,125 @@
 Data validation utilities for Nine Cycle project.
 """
 
+import functools
+import io
 import logging
-import re
+import string
+import threading
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
+import numpy as np
+from sqlalchemy import case, distinct, func, or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
 
 from .config import settings, HISTORICAL_CATEGORIES, EVENT_SEVERITY_LEVELS
-from .database import get_database_manager
+from .database import get_database_manager, build_collection_stats, HistoricalEvent, STREAM_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Above this many ids, deletes go through a COPY-loaded temp table instead of ANY(:ids)
+TEMP_TABLE_DELETE_THRESHOLD = 5000
+
+# Characters allowed in a domain label and a top-level domain
+_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + '-')
+_TLD_CHARS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+
+# Accepted date string formats
+_DATE_FORMAT = '%Y-%m-%d'
+_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_ISO_FORMAT = '%Y-%m-%dT%H:%M:%S'
+_ISO_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+@functools.lru_cache(maxsize=8192)
+def _is_valid_date_str(date_str: str) -> bool:
+    """Check a date string against the accepted formats (memoized; batches repeat dates)."""
+    # Only one format can match a given shape, so pick it instead of probing
+    # all four (strptime literals are case-insensitive)
+    if 'T' in date_str or 't' in date_str:
+        fmt = _ISO_UTC_FORMAT if date_str.endswith(('Z', 'z')) else _ISO_FORMAT
+    elif ':' in date_str:
+        fmt = _DATETIME_FORMAT
+    else:
+        fmt = _DATE_FORMAT
+    
+    try:
+        datetime.strptime(date_str, fmt)
+        return True
+    except ValueError:
+        return False
+
+def _is_valid_host(host: str) -> bool:
+    """Check a URL host: a dotted domain name, localhost, or an IPv4 address."""
+    if host.lower() == 'localhost':
+        return True
+    
+    # IPv4 address (four groups of 1-3 digits, no trailing dot)
+    parts = host.split('.')
+    if len(parts) == 4 and all(0 < len(part) <= 3 and _DIGITS.issuperset(part) for part in parts):
+        return True
+    
+    # Only a domain name may end with the root '.'
+    if host.endswith('.'):
+        parts = host[:-1].split('.')
+    if len(parts) < 2:
+        return False
+    
+    # Domain: labels of up to 63 characters not starting or ending with '-', then a 2-6 letter TLD
+    tld = parts[-1]
+    if not (2 <= len(tld) <= 6 and _TLD_CHARS.issuperset(tld)):
+        return False
+    for label in parts[:-1]:
+        if not (0 < len(label) <= 63 and _LABEL_CHARS.issuperset(label)):
+            return False
+        if label[0] == '-' or label[-1] == '-':
+            return False
+    return True
+
+def _fast_valid_url(url: str) -> bool:
+    """
+    Check an http(s) URL with a single linear scan.
+    
+    Accepts the same URLs as the former validation regex: scheme, host
+    (domain, localhost or IPv4), optional port, then an optional path or
+    query without whitespace.
+    """
+    if not isinstance(url, str) or not url:
+        return False
+    if url.endswith('\n'):
+        url = url[:-1]
+    
+    scheme = url[:8].lower()
+    if scheme.startswith('https://'):
+        rest = url[8:]
+    elif scheme.startswith('http://'):
+        rest = url[7:]
+    else:
+        return False
+    
+    # Split authority from path/query at the first '/' or '?'
+    end = len(rest)
+    for separator in '/?':
+        index = rest.find(separator, 0, end)
+        if index != -1:
+            end = index
+    authority, tail = rest[:end], rest[end:]
+    
+    if tail and tail != '/' and (len(tail) < 2 or tail.split() != [tail]):
+        return False
+    
+    host, has_port, port = authority.partition(':')
+    if has_port and not (port and _DIGITS.issuperset(port)):
+        return False
+    
+    return _is_valid_host(host)
+
+def _incorrect_root_clause():
+    """SQL predicate for events whose stored digital root does not match their year."""
+    return HistoricalEvent.digital_root != 1 + (HistoricalEvent.year - 1) % 9
+
 class DataValidator:
     """Data validation and quality control for collected events."""
     
@@ -26,10 +133,94 @@ class DataValidator:
             'description_length': (0, 5000),
             'severity_range': (1, 5),
             'digital_root_range': (1, 9),
-            'required_fields': ['year', 'title', 'category', 'source'],
-            'valid_categories': list(HISTORICAL_CATEGORIES.keys()),
-            'valid_severity_levels': list(EVENT_SEVERITY_LEVELS.values())
+            'required_fields': ('year', 'title', 'category', 'source'),
+            'valid_categories': frozenset(HISTORICAL_CATEGORIES.keys()),
+            'valid_severity_levels': frozenset(EVENT_SEVERITY_LEVELS.values())
         }
+        self.refresh_rules()
+    
+    def refresh_rules(self):
+        """Snapshot validation_rules into attributes; call again after changing the rules."""
+        rules = self.validation_rules
+        self._required_fields = tuple(rules['required_fields'])
+        self._year_range = rules['year_range']
+        self._year_min, self._year_max = rules['year_range']
+        self._title_min, self._title_max = rules['title_length']
+        self._description_max = rules['description_length'][1]
+        self._valid_categories = rules['valid_categories']
+        self._valid_severity_levels = rules['valid_severity_levels']
+        self._dr_min, self._dr_max = rules['digital_root_range']
+        self._compile_validator()
+    
+    def _compile_validator(self):
+        """
+        Generate the per-event check function for the current rules.
+        
+        Range bounds and required fields are inlined as literals so the hot path
+        does no rule lookups; the result is stored as self._validate_fast.
+        """
+        lines = [
+            "def _validate_fast(event_data):",
+            "    errors = []",
+            "    get = event_data.get",
+        ]
+        
+        for field in self._required_fields:
+            lines += [
+                f"    if get({field!r}) is None:",
+                f"        errors.append({'Missing required field: ' + str(field)!r})",
+            ]
+        
+        year_range_text = str(self._year_range)
+        title_range_text = f"{self._title_min}-{self._title_max}"
+        dr_range_text = f"{self._dr_min}-{self._dr_max}"
+        lines += [
+            "    year = get('year')",
+            "    if year is not None:",
+            "        if not isinstance(year, int):",
+            "            errors.append('Year must be an integer')",
+            f"        elif not ({self._year_min!r} <= year <= {self._year_max!r}):",
+            f"            errors.append('Year %s outside valid range %s' % (year, {year_range_text!r}))",
+            "    title = get('title', '')",
+            "    if title:",
+            "        title_len = len(str(title))",
+            f"        if not ({self._title_min!r} <= title_len <= {self._title_max!r}):",
+            f"            errors.append('Title length %s outside valid range %s' % (title_len, {title_range_text!r}))",
+            "    description = get('description', '')",
+            "    if description:",
+            "        desc_len = len(str(description))",
+            f"        if desc_len > {self._description_max!r}:",
+            f"            errors.append('Description length %s exceeds maximum %s' % (desc_len, {str(self._description_max)!r}))",
+            "    category = get('category')",
+            "    if category and category not in valid_categories:",
+            "        errors.append('Invalid category: %s' % (category,))",
+            "    severity = get('severity')",
+            "    if severity is not None:",
+            "        if not isinstance(severity, int):",
+            "            errors.append('Severity must be an integer')",
+            "        elif severity not in valid_severity_levels:",
+            "            errors.append('Invalid severity level: %s' % (severity,))",
+            "    digital_root = get('digital_root')",
+            "    if digital_root is not None:",
+            f"        if not ({self._dr_min!r} <= digital_root <= {self._dr_max!r}):",
+            f"            errors.append('Digital root %s outside valid range %s' % (digital_root, {dr_range_text!r}))",
+            "    source_url = get('source_url')",
+            "    if source_url and not is_valid_url(source_url):",
+            "        errors.append('Invalid URL format')",
+            "    date = get('date')",
+            "    if date and not is_valid_date(date):",
+            "        errors.append('Invalid date format')",
+            "    return errors",
+        ]
+        
+        namespace = {
+            'valid_categories': self._valid_categories,
+            'valid_severity_levels': self._valid_severity_levels,
+            'is_valid_url': self.is_valid_url,
+            'is_valid_date': self.is_valid_date,
+        }
+        exec(compile("\n".join(lines), "<data_validator>", "exec"), namespace)
+        self._validate_fast = namespace['_validate_fast']
     
     def validate_event(self, event_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -41,79 +232,12 @@ class DataValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-        
-        # Check required fields
-        for field in self.validation_rules['required_fields']:
-            if field not in event_data or event_data[field] is None:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate year
-        year = event_data.get('year')
-        if year is not None:
-            if not isinstance(year, int):
-                errors.append("Year must be an integer")
-            elif not (self.validation_rules['year_range'][0] <= year <= self.validation_rules['year_range'][1]):
-                errors.append(f"Year {year} outside valid range {self.validation_rules['year_range']}")
-        
-        # Validate title
-        title = event_data.get('title', '')
-        if title:
-            title_len = len(str(title))
-            min_len, max_len = self.validation_rules['title_length']
-            if not (min_len <= title_len <= max_len):
-                errors.append(f"Title length {title_len} outside valid range {min_len}-{max_len}")
-        
-        # Validate description
-        description = event_data.get('description', '')
-        if description:
-            desc_len = len(str(description))
-            max_len = self.validation_rules['description_length'][1]
-            if desc_len > max_len:
-                errors.append(f"Description length {desc_len} exceeds maximum {max_len}")
-        
-        # Validate category
-        category = event_data.get('category')
-        if category and category not in self.validation_rules['valid_categories']:
-            errors.append(f"Invalid category: {category}")
-        
-        # Validate severity
-        severity = event_data.get('severity')
-        if severity is not None:
-            if not isinstance(severity, int):
-                errors.append("Severity must be an integer")
-            elif severity not in self.validation_rules['valid_severity_levels']:
-                errors.append(f"Invalid severity level: {severity}")
-        
-        # Validate digital root
-        digital_root = event_data.get('digital_root')
-        if digital_root is not None:
-            min_dr, max_dr = self.validation_rules['digital_root_range']
-            if not (min_dr <= digital_root <= max_dr):
-                errors.append(f"Digital root {digital_root} outside valid range {min_dr}-{max_dr}")
-        
-        # Validate URL format if present
-        source_url = event_data.get('source_url')
-        if source_url and not self.is_valid_url(source_url):
-            errors.append("Invalid URL format")
-        
-        # Validate date format if present
-        date = event_data.get('date')
-        if date and not self.is_valid_date(date):
-            errors.append("Invalid date format")
-        
+        errors = self._validate_fast(event_data)
         return len(errors) == 0, errors
     
     def is_valid_url(self, url: str) -> bool:
         """Check if URL format is valid."""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return url_pattern.match(url) is not None
+        return _fast_valid_url(url)
     
     def is_valid_date(self, date_val: Any) -> bool:
         """Check if date is valid."""
@@ -121,20 +245,7 @@ class DataValidator:
             return True
         
         if isinstance(date_val, str):
-            # Try common date formats
-            date_formats = [
-                '%Y-%m-%d',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%SZ'
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    datetime.strptime(date_val, fmt)
-                    return True
-                except ValueError:
-                    continue
+            return _is_valid_date_str(date_val)
         
         return False
     
@@ -184,24 +295,29 @@ class DataValidator:
         
         stats = self.db_manager.get_collection_stats()
         
+        # Check year coverage
+        with self.db_manager.get_session() as session:
+            year_coverage = tuple(session.query(
+                func.min(HistoricalEvent.year),
+                func.max(HistoricalEvent.year),
+                func.count(distinct(HistoricalEvent.year))
+            ).one())
+        
+        return self._build_completeness_section(stats, year_coverage)
+    
+    def _build_completeness_section(self, stats: Dict[str, Any], year_coverage: tuple) -> Dict[str, Any]:
+        """Build the completeness section from collection stats and (min_year, max_year, unique_years)."""
         # Calculate completeness metrics
         total_events = stats['total_events']
         verified_events = stats['verified_events']
         category_distribution = stats['category_distribution']
         digital_root_distribution = stats['digital_root_distribution']
         
-        # Check year coverage
-        with self.db_manager.get_session() as session:
-            year_coverage = session.execute(
-                "SELECT MIN(year) as min_year, MAX(year) as max_year, COUNT(DISTINCT year) as unique_years FROM historical_events"
-            ).fetchone()
-        
-        # Expected digital root distribution (should be roughly equal)
-        expected_dr_distribution = {i: total_events / 9 for i in range(1, 10)}
-        dr_distribution_variance = sum(
-            abs(digital_root_distribution.get(i, 0) - expected_dr_distribution[i]) 
-            for i in range(1, 10)
-        ) / total_events if total_events > 0 else 0
+        # Deviation from the expected (uniform) digital root distribution
+        dr_counts = np.array([digital_root_distribution.get(i, 0) for i in range(1, 10)], dtype=np.float64)
+        dr_distribution_variance = float(
+            np.abs(dr_counts - total_events / 9).sum() / total_events
+        ) if total_events > 0 else 0
         
         return {
             'total_events': total_events,
@@ -233,7 +349,10 @@ class DataValidator:
         score += min(year_coverage_pct / 100, 1.0) * 30
         
         # Category balance (15% of score)
-        category_balance = 1.0 - (len(set(stats['category_distribution'].values())) - 1) / len(stats['category_distribution']) if stats['category_distribution'] else 0
+        category_counts = stats['category_distribution']
+        category_balance = float(
+            1.0 - (np.unique(np.fromiter(category_counts.values(), dtype=np.int64)).size - 1) / len(category_counts)
+        ) if category_counts else 0
         score += category_balance * 15
         
         # Digital root distribution (15% of score)
@@ -247,17 +366,21 @@ class DataValidator:
         if not self.db_manager.connected:
             return []
         
-        # Find events with similar titles and same year
+        # Find events with similar titles and same year. The pg_trgm '%' operator
+        # can use the GIN trigram index on title to generate candidates, so the
+        # threshold is raised to match the similarity cut-off.
         with self.db_manager.get_session() as session:
-            duplicates = session.execute("""
+            session.execute(text("SET LOCAL pg_trgm.similarity_threshold = 0.8"))
+            duplicates = session.execute(text("""
                 SELECT e1.id, e1.title, e1.year, e1.source,
                        e2.id as duplicate_id, e2.title as duplicate_title, e2.source as duplicate_source
                 FROM historical_events e1
                 JOIN historical_events e2 ON e1.year = e2.year 
                     AND e1.id < e2.id
-                    AND similarity(e1.title, e2.title) > 0.8
+                    AND e1.title % e2.title
+                WHERE similarity(e1.title, e2.title) > 0.8
                 ORDER BY e1.year, e1.title
-            """).fetchall()
+            """)).fetchall()
         
         return [
             {
@@ -277,45 +400,131 @@ class DataValidator:
         if not self.db_manager.connected:
             return {'error': 'Database not connected'}
         
-        with self.db_manager.get_session() as session:
-            events = session.execute(
-                "SELECT id, year, digital_root FROM historical_events"
-            ).fetchall()
-        
-        incorrect_roots = []
-        
-        for event_id, year, stored_root in events:
-            calculated_root = self.calculate_digital_root(year)
-            if calculated_root != stored_root:
-                incorrect_roots.append({
-                    'event_id': event_id,
-                    'year': year,
-                    'stored_root': stored_root,
-                    'calculated_root': calculated_root
-                })
+        try:
+            total_events, incorrect_count, offenders = self._find_incorrect_roots_sql()
+        except SQLAlchemyError as e:
+            logger.warning(f"SQL digital root check failed, falling back to NumPy: {e}")
+            total_events, incorrect_count, offenders = self._find_incorrect_roots_numpy()
         
-        accuracy_rate = ((len(events) - len(incorrect_roots)) / len(events) * 100) if events else 100
+        return self._build_digital_root_section(total_events, incorrect_count, offenders)
+    
+    def _build_digital_root_section(
+        self,
+        total_events: int,
+        incorrect_count: int,
+        offenders: List[Tuple[int, int, int]]
+    ) -> Dict[str, Any]:
+        """Build the digital root section from counts and (id, year, stored_root) offenders."""
+        incorrect_roots = [
+            {
+                'event_id': event_id,
+                'year': year,
+                'stored_root': stored_root,
+                'calculated_root': self.calculate_digital_root(year)
+            }
+            for event_id, year, stored_root in offenders
+        ]
+        
+        accuracy_rate = ((total_events - incorrect_count) / total_events * 100) if total_events else 100
         
         return {
-            'total_events': len(events),
-            'incorrect_digital_roots': len(incorrect_roots),
+            'total_events': total_events,
+            'incorrect_digital_roots': incorrect_count,
             'accuracy_rate': accuracy_rate,
-            'incorrect_events': incorrect_roots[:10],  # Show first 10 errors
+            'incorrect_events': incorrect_roots,  # First 10 errors
             'status': 'pass' if accuracy_rate >= 99 else 'fail'
         }
     
+    def _find_incorrect_roots_sql(self) -> Tuple[int, int, List[Tuple[int, int, int]]]:
+        """Count events with wrong digital roots in the database; return up to 10 offenders."""
+        # Closed-form digital root check runs in the database; only offenders come back
+        incorrect_clause = _incorrect_root_clause()
+        
+        with self.db_manager.get_session() as session:
+            total_events = session.query(func.count(HistoricalEvent.id)).scalar()
+            incorrect_count = session.query(func.count(HistoricalEvent.id)).filter(incorrect_clause).scalar()
+            offenders = session.query(
+                HistoricalEvent.id, HistoricalEvent.year, HistoricalEvent.digital_root
+            ).filter(incorrect_clause).order_by(HistoricalEvent.id).limit(10).all()
+        
+        return total_events, incorrect_count, [tuple(row) for row in offenders]
+    
+    def _find_incorrect_roots_numpy(self) -> Tuple[int, int, List[Tuple[int, int, int]]]:
+        """Same as _find_incorrect_roots_sql, computed with NumPy for databases without modulo support."""
+        total_events = 0
+        incorrect_count = 0
+        offenders = []
+        
+        with self.db_manager.get_session() as session:
+            result = session.execute(
+                select(HistoricalEvent.id, HistoricalEvent.year, HistoricalEvent.digital_root)
+                .order_by(HistoricalEvent.id)
+                .execution_options(stream_results=True)
+            )
+            for rows in result.partitions(STREAM_CHUNK_SIZE):
+                events = np.array(rows, dtype=np.int64)
+                years = events[:, 1]
+                expected = np.where(years > 9, 1 + (years - 1) % 9, years)
+                incorrect = events[expected != events[:, 2]]
+                
+                total_events += len(events)
+                incorrect_count += len(incorrect)
+                if len(offenders) < 10:
+                    offenders.extend(tuple(int(v) for v in row) for row in incorrect[:10 - len(offenders)])
+        
+        return total_events, incorrect_count, offenders
+    
     def calculate_digital_root(self, year: int) -> int:
         """Calculate digital root of a year."""
-        while year > 9:
-            year = sum(int(digit) for digit in str(year))
-        return year
+        return 1 + (year - 1) % 9 if year > 9 else year
+    
+    def _collect_report_sections(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the completeness and digital root sections in one session.
+        
+        Totals, year coverage and the incorrect-root count come from a single
+        aggregate query instead of separate scans per check.
+        """
+        if not self.db_manager.connected:
+            return self.check_data_completeness(), self.validate_digital_roots()
+        
+        incorrect_clause = _incorrect_root_clause()
+        
+        with self.db_manager.get_session() as session:
+            (total_events, verified_events, min_year, max_year,
+             unique_years, incorrect_count) = session.query(
+                func.count(HistoricalEvent.id),
+                func.coalesce(func.sum(case((HistoricalEvent.verified == True, 1), else_=0)), 0),
+                func.min(HistoricalEvent.year),
+                func.max(HistoricalEvent.year),
+                func.count(distinct(HistoricalEvent.year)),
+                func.coalesce(func.sum(case((incorrect_clause, 1), else_=0)), 0)
+            ).one()
+            
+            stats = build_collection_stats(session, total_events, verified_events)
+            
+            offenders = session.query(
+                HistoricalEvent.id, HistoricalEvent.year, HistoricalEvent.digital_root
+            ).filter(incorrect_clause).order_by(HistoricalEvent.id).limit(10).all() if incorrect_count else []
+        
+        return (
+            self._build_completeness_section(stats, (min_year, max_year, unique_years)),
+            self._build_digital_root_section(total_events, incorrect_count, [tuple(row) for row in offenders])
+        )
     
     def generate_validation_report(self, output_file: Optional[str] = None) -> Dict[str, Any]:
         """Generate comprehensive validation report."""
+        try:
+            data_completeness, digital_root_validation = self._collect_report_sections()
+        except SQLAlchemyError as e:
+            logger.warning(f"Combined report query failed, running checks separately: {e}")
+            data_completeness = self.check_data_completeness()
+            digital_root_validation = self.validate_digital_roots()
+        
         report = {
             'timestamp': datetime.now().isoformat(),
-            'data_completeness': self.check_data_completeness(),
-            'digital_root_validation': self.validate_digital_roots(),
+            'data_completeness': data_completeness,
+            'digital_root_validation': digital_root_validation,
             'duplicate_detection': self.detect_duplicates()
         }
         
@@ -347,37 +556,82 @@ class DataValidator:
         
         return report
     
+    def _invalid_event_clause(self):
+        """
+        SQL predicate matching every row validate_event could reject.
+        
+        It may also match a few valid rows (e.g. empty titles), so matches
+        are confirmed in Python.
+        """
+        return or_(
+            HistoricalEvent.year.is_(None),
+            HistoricalEvent.title.is_(None),
+            HistoricalEvent.category.is_(None),
+            HistoricalEvent.source.is_(None),
+            ~HistoricalEvent.year.between(self._year_min, self._year_max),
+            ~func.length(HistoricalEvent.title).between(self._title_min, self._title_max),
+            func.length(HistoricalEvent.description) > self._description_max,
+            HistoricalEvent.category.notin_(sorted(self._valid_categories)),
+            HistoricalEvent.severity.notin_(sorted(self._valid_severity_levels)),
+            ~HistoricalEvent.digital_root.between(self._dr_min, self._dr_max)
+        )
+    
+    def _validate_tuple(self, row: Tuple) -> bool:
+        """
+        Validate an (id, year, title, description, category, source, severity,
+        digital_root) row with the same rules as validate_event, without building
+        a dict or error messages.
+        """
+        _, year, title, description, category, source, severity, digital_root = row
+        
+        if year is None or title is None or category is None or source is None:
+            return False
+        
+        if not isinstance(year, int) or not (self._year_min <= year <= self._year_max):
+            return False
+        
+        if title and not (self._title_min <= len(str(title)) <= self._title_max):
+            return False
+        
+        if description and len(str(description)) > self._description_max:
+            return False
+        
+        if category and category not in self._valid_categories:
+            return False
+        
+        if severity is not None and (
+            not isinstance(severity, int) or severity not in self._valid_severity_levels
+        ):
+            return False
+        
+        if digital_root is not None and not (self._dr_min <= digital_root <= self._dr_max):
+            return False
+        
+        return True
+    
     def clean_invalid_events(self, dry_run: bool = True) -> Dict[str, Any]:
         """Clean invalid events from database."""
         if not self.db_manager.connected:
             return {'error': 'Database not connected'}
         
-        # Get all events and validate them
+        # Let the database shortlist rows that break a rule, then confirm in Python
         with self.db_manager.get_session() as session:
-            events = session.execute(
-                "SELECT id, year, title, description, category, source, severity, digital_root FROM historical_events"
-            ).fetchall()
-        
-        invalid_event_ids = []
-        
-        for event in events:
-            event_data = {
-                'id': event[0],
-                'year': event[1],
-                'title': event[2],
-                'description': event[3],
-                'category': event[4],
-                'source': event[5],
-                'severity': event[6],
-                'digital_root': event[7]
-            }
+            total_events = session.query(func.count(HistoricalEvent.id)).scalar()
+            events = session.query(
+                HistoricalEvent.id,
+                HistoricalEvent.year,
+                HistoricalEvent.title,
+                HistoricalEvent.description,
+                HistoricalEvent.category,
+                HistoricalEvent.source,
+                HistoricalEvent.severity,
+                HistoricalEvent.digital_root
+            ).filter(self._invalid_event_clause()).yield_per(STREAM_CHUNK_SIZE)
             
-            is_valid, errors = self.validate_event(event_data)
-            if not is_valid:
-                invalid_event_ids.append(event[0])
+            invalid_event_ids = [event[0] for event in events if not self._validate_tuple(event)]
         
         result = {
-            'total_events': len(events),
+            'total_events': total_events,
             'invalid_events': len(invalid_event_ids),
             'invalid_event_ids': invalid_event_ids,
             'dry_run': dry_run
@@ -385,19 +639,59 @@ class DataValidator:
         
         if not dry_run and invalid_event_ids:
             # Actually delete invalid events
+            use_temp_table = (
+                len(invalid_event_ids) > TEMP_TABLE_DELETE_THRESHOLD
+                and self.db_manager.engine.dialect.driver == 'psycopg2'
+            )
             with self.db_manager.get_session() as session:
-                deleted_count = session.execute(
-                    "DELETE FROM historical_events WHERE id = ANY(:ids)",
-                    {'ids': invalid_event_ids}
-                ).rowcount
+                if use_temp_table:
+                    deleted_count = self._delete_via_temp_table(session, invalid_event_ids)
+                else:
+                    deleted_count = session.execute(
+                        text("DELETE FROM historical_events WHERE id = ANY(:ids)"),
+                        {'ids': invalid_event_ids}
+                    ).rowcount
                 result['deleted_count'] = deleted_count
                 logger.info(f"Deleted {deleted_count} invalid events from database")
         
         return result
 
+    def _delete_via_temp_table(self, session, event_ids: List[int]) -> int:
+        """
+        Delete events by COPYing their ids into a temp table and joining against it.
+        
+        Avoids binding one huge array parameter for very large deletes. Runs on the
+        session's connection so it shares its transaction; the table drops on commit.
+        """
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute("CREATE TEMP TABLE tmp_bad_ids (id INTEGER PRIMARY KEY) ON COMMIT DROP")
+            cursor.copy_from(io.StringIO('\n'.join(map(str, event_ids))), 'tmp_bad_ids', columns=('id',))
+            cursor.execute("ANALYZE tmp_bad_ids")
+            cursor.execute(
+                "DELETE FROM historical_events USING tmp_bad_ids "
+                "WHERE historical_events.id = tmp_bad_ids.id"
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+# Shared validator so warm caches (compiled checks, rule snapshots) persist across calls
+_validator: Optional[DataValidator] = None
+_validator_lock = threading.Lock()
+
+def _get_validator() -> DataValidator:
+    """Get the shared DataValidator, creating it on first use."""
+    global _validator
+    if _validator is None:
+        with _validator_lock:
+            if _validator is None:
+                _validator = DataValidator()
+    return _validator
+
 def validate_data_file(file_path: str) -> Dict[str, Any]:
     """Validate data from a JSON file."""
-    validator = DataValidator()
+    validator = _get_validator()
     
     try:
         with open(file_path, 'r') as f:
@@ -425,5 +719,5 @@ def validate_data_file(file_path: str) -> Dict[str, Any]:
 
 def check_database_integrity() -> Dict[str, Any]:
     """Check database integrity and consistency."""
-    validator = DataValidator()
+    validator = _get_validator()
     return validator.generate_validation_report()
@@ -5,7 +5,7 @@ Database utilities and connection management for Nine Cycle project.
 import logging
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
-from sqlalchemy import create_engine, Table, Column, Integer, String, Text, DateTime, Float, Boolean, text
+from sqlalchemy import create_engine, Table, Column, Integer, String, Text, DateTime, Float, Boolean, text, func, case, select, insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # SQLAlchemy setup
 Base = declarative_base()
 
+# Rows fetched per round-trip when streaming large result sets
+STREAM_CHUNK_SIZE = 10_000
+
 class HistoricalEvent(Base):
     """Historical event model for database storage."""
     
@@ -78,6 +81,26 @@ class DataCollectionLog(Base):
     error_details = Column(Text, nullable=True)
     collection_metadata = Column(Text, nullable=True)  # JSON string
 
+def build_collection_stats(session: Session, total_events: int, verified_events: int) -> Dict[str, Any]:
+    """Build collection statistics from already-counted totals plus per-category and per-root counts."""
+    category_counts = session.query(
+        HistoricalEvent.category,
+        func.count(HistoricalEvent.id)
+    ).group_by(HistoricalEvent.category).all()
+
+    digital_root_counts = session.query(
+        HistoricalEvent.digital_root,
+        func.count(HistoricalEvent.id)
+    ).group_by(HistoricalEvent.digital_root).all()
+
+    return {
+        'total_events': total_events,
+        'verified_events': verified_events,
+        'verification_rate': verified_events / total_events if total_events > 0 else 0,
+        'category_distribution': dict(category_counts),
+        'digital_root_distribution': dict(digital_root_counts)
+    }
+
 class DatabaseManager:
     """Database connection and operations manager."""
     
@@ -124,6 +147,24 @@ class DatabaseManager:
         except SQLAlchemyError as e:
             logger.error(f"Failed to create tables: {e}")
             raise
+        
+        self.create_title_trigram_index()
+    
+    def create_title_trigram_index(self):
+        """Create the pg_trgm GIN index used for duplicate title detection (PostgreSQL only)."""
+        if self.engine.dialect.name != 'postgresql':
+            return
+        
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_historical_events_title_trgm "
+                    "ON historical_events USING gin (title gin_trgm_ops)"
+                ))
+            logger.info("Title trigram index created successfully")
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not create title trigram index: {e}")
     
     def drop_tables(self):
         """Drop all database tables."""
@@ -160,10 +201,13 @@ class DatabaseManager:
     
     def bulk_insert_events(self, events_data: List[Dict[str, Any]]) -> int:
         """Bulk insert historical events."""
+        if not events_data:
+            return 0
+        
+        # executemany-style insert straight from the dicts, no ORM objects
         with self.get_session() as session:
-            events = [HistoricalEvent(**event_data) for event_data in events_data]
-            session.bulk_save_objects(events)
-            return len(events)
+            session.execute(insert(HistoricalEvent), events_data)
+            return len(events_data)
     
     def get_events_by_year_range(self, start_year: int, end_year: int) -> List[HistoricalEvent]:
         """Get events within a year range."""
@@ -208,71 +252,51 @@ class DatabaseManager:
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get data collection statistics."""
         with self.get_session() as session:
-            total_events = session.query(HistoricalEvent).count()
-            verified_events = session.query(HistoricalEvent).filter(
-                HistoricalEvent.verified == True
-            ).count()
+            total_events, verified_events = session.query(
+                func.count(HistoricalEvent.id),
+                func.coalesce(func.sum(case((HistoricalEvent.verified == True, 1), else_=0)), 0)
+            ).one()
             
-            category_counts = session.query(
-                HistoricalEvent.category,
-                session.query(HistoricalEvent).filter(
-                    HistoricalEvent.category == HistoricalEvent.category
-                ).count()
-            ).group_by(HistoricalEvent.category).all()
-            
-            digital_root_counts = session.query(
-                HistoricalEvent.digital_root,
-                session.query(HistoricalEvent).filter(
-                    HistoricalEvent.digital_root == HistoricalEvent.digital_root
-                ).count()
-            ).group_by(HistoricalEvent.digital_root).all()
-            
-            return {
-                'total_events': total_events,
-                'verified_events': verified_events,
-                'verification_rate': verified_events / total_events if total_events > 0 else 0,
-                'category_distribution': dict(category_counts),
-                'digital_root_distribution': dict(digital_root_counts)
-            }
+            return build_collection_stats(session, total_events, verified_events)
     
     def export_events_to_dataframe(self, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Export events to pandas DataFrame."""
+        stmt = select(
+            HistoricalEvent.id,
+            HistoricalEvent.year,
+            HistoricalEvent.date,
+            HistoricalEvent.title,
+            HistoricalEvent.description,
+            HistoricalEvent.category,
+            HistoricalEvent.subcategory,
+            HistoricalEvent.severity,
+            HistoricalEvent.digital_root,
+            HistoricalEvent.source,
+            HistoricalEvent.location,
+            HistoricalEvent.impact_score,
+            HistoricalEvent.verified,
+            HistoricalEvent.created_at
+        )
+        
+        if filters:
+            if 'start_year' in filters:
+                stmt = stmt.where(HistoricalEvent.year >= filters['start_year'])
+            if 'end_year' in filters:
+                stmt = stmt.where(HistoricalEvent.year <= filters['end_year'])
+            if 'category' in filters:
+                stmt = stmt.where(HistoricalEvent.category == filters['category'])
+            if 'verified_only' in filters and filters['verified_only']:
+                stmt = stmt.where(HistoricalEvent.verified == True)
+        
+        # Read rows straight into typed columns, skipping ORM object construction,
+        # streaming from a server-side cursor in bounded chunks
+        stmt = stmt.execution_options(stream_results=True)
         with self.get_session() as session:
-            query = session.query(HistoricalEvent)
-            
-            if filters:
-                if 'start_year' in filters:
-                    query = query.filter(HistoricalEvent.year >= filters['start_year'])
-                if 'end_year' in filters:
-                    query = query.filter(HistoricalEvent.year <= filters['end_year'])
-                if 'category' in filters:
-                    query = query.filter(HistoricalEvent.category == filters['category'])
-                if 'verified_only' in filters and filters['verified_only']:
-                    query = query.filter(HistoricalEvent.verified == True)
-            
-            events = query.all()
-            
-            # Convert to DataFrame
-            data = []
-            for event in events:
-                data.append({
-                    'id': event.id,
-                    'year': event.year,
-                    'date': event.date,
-                    'title': event.title,
-                    'description': event.description,
-                    'category': event.category,
-                    'subcategory': event.subcategory,
-                    'severity': event.severity,
-                    'digital_root': event.digital_root,
-                    'source': event.source,
-                    'location': event.location,
-                    'impact_score': event.impact_score,
-                    'verified': event.verified,
-                    'created_at': event.created_at
-                })
-            
-            return pd.DataFrame(data)
+            chunks = list(pd.read_sql(stmt, session.connection(), chunksize=STREAM_CHUNK_SIZE))
+        
+        if not chunks:
+            return pd.DataFrame(columns=[column.name for column in stmt.selected_columns])
+        return pd.concat(chunks, ignore_index=True)
 
 # Global database manager instance
 db_manager = DatabaseManager()
@@ -2,12 +2,23 @@
 Logging configuration for Nine Cycle project.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import operator
+import os
+import queue
+import re
+import stat
 import sys
+import threading
+import time
+import traceback
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 try:
     import structlog
     HAS_STRUCTLOG = True
@@ -16,15 +27,294 @@ except ImportError:
     structlog = None
 
 try:
-    from loguru import logger as loguru_logger
-    HAS_LOGURU = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_LOGURU = False
-    loguru_logger = None
+    HAS_ORJSON = False
+    orjson = None
 
 from .config import settings
 
-class ColoredFormatter(logging.Formatter):
+# Background listener that performs handler I/O off the calling thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Most records the listener handles before flushing batched handlers
+LOG_BATCH_SIZE = 512
+
+def _stop_queue_listener():
+    """Flush queued records and stop the background listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
+# Level names accepted by setup_logging (case-insensitive)
+_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+# setup_logging() is a no-op when called again with the same arguments
+_CONFIGURED = False
+_LAST_ARGS: Optional[tuple] = None
+_CONFIG_LOCK = threading.Lock()
+
+def _orjson_serializer(obj, default=None, **kwargs) -> str:
+    """structlog serializer backed by orjson (naive datetimes are treated as UTC)."""
+    return orjson.dumps(
+        obj,
+        default=default,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+def _event_timestamp():
+    """Timestamp for structured events; orjson serializes datetimes natively."""
+    now = datetime.utcnow()
+    return now if HAS_ORJSON else now.isoformat()
+
+class _LoggerPrefixFilter(logging.Filter):
+    """Pass records from any of the given loggers or their children."""
+    
+    def __init__(self, names):
+        super().__init__()
+        self.names = tuple(names)
+        self.prefixes = tuple(f"{name}." for name in names)
+        self._decisions = {}  # logger name -> passes; the set of names is small
+    
+    def filter(self, record):
+        name = record.name
+        passes = self._decisions.get(name)
+        if passes is None:
+            passes = self._decisions[name] = name in self.names or name.startswith(self.prefixes)
+        return passes
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that buffers formatted records and writes each batch
+    with a single write + flush.
+    
+    Meant to run behind _BatchingQueueListener, which calls flush_batch() after
+    draining the queue. Rollover is checked once per batch against an in-memory
+    byte count; the file is only stat'ed when it is (re)opened.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._byte_count: Optional[int] = None  # None until the open file is stat'ed
+        self._rotatable = False
+        super().__init__(*args, **kwargs)
+        self._pending: List[str] = []
+    
+    def _open(self):
+        self._byte_count = None
+        return super()._open()
+    
+    def _sync_byte_count(self):
+        """Read the size of a freshly opened file; only regular files rotate."""
+        file_stat = os.fstat(self.stream.fileno())
+        self._rotatable = stat.S_ISREG(file_stat.st_mode)
+        self._byte_count = file_stat.st_size
+    
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+    
+    def flush_batch(self):
+        """Write all pending records to the log file."""
+        self.acquire()
+        try:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            
+            if self.stream is None:  # delay was set
+                self.stream = self._open()
+            batch = ''.join(pending)
+            
+            if self.maxBytes > 0:
+                if self._byte_count is None:
+                    self._sync_byte_count()
+                batch_bytes = len(batch.encode(self.stream.encoding, self.stream.errors))
+                if (self._rotatable and self._byte_count > 0
+                        and self._byte_count + batch_bytes >= self.maxBytes):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self._sync_byte_count()
+                self._byte_count += batch_bytes
+            
+            # The buffered stream retries short writes until the whole batch is out
+            self.stream.write(batch)
+            self.stream.flush()
+        except Exception:
+            if logging.raiseExceptions:
+                sys.stderr.write("--- Logging error while writing batch ---\n")
+                traceback.print_exc(file=sys.stderr)
+        finally:
+            self.release()
+    
+    def flush(self):
+        self.flush_batch()
+        super().flush()
+    
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+class BatchedConsoleHandler(logging.StreamHandler):
+    """
+    Stream handler that buffers formatted records and writes each batch with a
+    single write + flush; flush_batch() is driven by _BatchingQueueListener.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._pending: List[str] = []
+    
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+    
+    def flush_batch(self):
+        """Write all pending records to the stream."""
+        self.acquire()
+        try:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            self.stream.write(''.join(pending))
+            self.stream.flush()
+        except Exception:
+            if logging.raiseExceptions:
+                sys.stderr.write("--- Logging error while writing batch ---\n")
+                traceback.print_exc(file=sys.stderr)
+        finally:
+            self.release()
+    
+    def flush(self):
+        self.flush_batch()
+        super().flush()
+
+class _BoundedLogQueue:
+    """
+    Bounded log queue that drops the oldest record when full, so a stalled
+    listener cannot grow memory without limit. Used when LOG_QUEUE_MAXSIZE > 0.
+    
+    The listener's stop sentinel is never stored in the deque, so it cannot be
+    evicted: it is handed out once the records queued before it are drained.
+    """
+    
+    _SENTINEL = logging.handlers.QueueListener._sentinel
+    
+    def __init__(self, maxsize: int):
+        self._records = deque(maxlen=maxsize)
+        self._not_empty = threading.Condition(threading.Lock())
+        self._stop_after: Optional[int] = None  # Records left before the sentinel
+    
+    def put_nowait(self, record):
+        with self._not_empty:
+            if record is self._SENTINEL:
+                self._stop_after = len(self._records)
+            else:
+                if self._stop_after and len(self._records) == self._records.maxlen:
+                    self._stop_after -= 1  # A pre-stop record is about to be evicted
+                self._records.append(record)
+            self._not_empty.notify()
+    
+    put = put_nowait
+    
+    def _ready(self) -> bool:
+        return bool(self._records) or self._stop_after == 0
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        with self._not_empty:
+            if not block:
+                if not self._ready():
+                    raise queue.Empty
+            elif not self._not_empty.wait_for(self._ready, timeout):
+                raise queue.Empty
+            
+            if self._stop_after == 0:
+                self._stop_after = None
+                return self._SENTINEL
+            if self._stop_after is not None:
+                self._stop_after -= 1
+            return self._records.popleft()
+    
+    def empty(self) -> bool:
+        return not self._ready()
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains queued records in batches and flushes batched handlers once per batch."""
+    
+    def _monitor(self):
+        while True:
+            record = self.dequeue(True)
+            if record is self._sentinel:
+                break
+            self.handle(record)
+            
+            # Take whatever else is already queued before flushing
+            for _ in range(LOG_BATCH_SIZE - 1):
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    self._flush_batches()
+                    return
+                self.handle(record)
+            
+            self._flush_batches()
+    
+    def _flush_batches(self):
+        for handler in self.handlers:
+            flush_batch = getattr(handler, 'flush_batch', None)
+            if flush_batch is not None:
+                flush_batch()
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for records within the same
+    second and renders %-style formats from a template compiled once.
+    """
+    
+    _FORMAT_FIELD = re.compile(r'%\((\w+)\)')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')
+        
+        # '%(name)s | %(message)s' -> '%s | %s' plus a getter for ('name', 'message')
+        self._template = None
+        fmt = self._style._fmt
+        if type(self._style) is logging.PercentStyle and not self._style._defaults and '%%' not in fmt:
+            fields = self._FORMAT_FIELD.findall(fmt)
+            if len(fields) > 1:
+                self._template = self._FORMAT_FIELD.sub('%', fmt)
+                self._template_fields = operator.itemgetter(*fields)
+    
+    def formatMessage(self, record):
+        if self._template is None:
+            return super().formatMessage(record)
+        return self._template % self._template_fields(record.__dict__)
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, formatted)
+        
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colors for different log levels."""
     
     COLORS = {
@@ -35,11 +325,30 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m', # Magenta
     }
     RESET = '\033[0m'
+    COLORED_LEVELNAMES = {}  # levelname -> pre-coloured levelname, filled in below
+    
+    def __init__(self, *args, use_color: Optional[bool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if use_color is None:
+            isatty = getattr(sys.stdout, 'isatty', None)
+            use_color = bool(isatty and isatty())
+        self.use_color = use_color
     
     def format(self, record):
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        return super().format(record)
+        if not self.use_color:
+            return super().format(record)
+        
+        # Colour only this handler's output; other handlers share the record
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELNAMES.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+ColoredFormatter.COLORED_LEVELNAMES.update(
+    (name, f"{color}{name}{ColoredFormatter.RESET}") for name, color in ColoredFormatter.COLORS.items()
+)
 
 def setup_logging(
     log_level: str = None,
@@ -54,73 +363,94 @@ def setup_logging(
         log_file: Optional log file path
         enable_structlog: Whether to enable structured logging
     """
-    log_level = log_level or settings.LOG_LEVEL
+    global _CONFIGURED, _LAST_ARGS
+    log_level = (log_level or settings.LOG_LEVEL).upper()
+    if log_level not in _LEVELS:
+        raise ValueError(f"Unknown log level: {log_level}")
+    args = (log_level, log_file, enable_structlog)
+    
+    with _CONFIG_LOCK:
+        if _CONFIGURED and args == _LAST_ARGS:
+            return
+        _configure_logging(log_level, log_file, enable_structlog)
+        _CONFIGURED = True
+        _LAST_ARGS = args
+
+def _configure_logging(log_level: str, log_file: Optional[str], enable_structlog: bool):
+    """Build handlers and start the queue listener (called under _CONFIG_LOCK)."""
+    global _queue_listener
+    level = _LEVELS[log_level]
     
     # Ensure logs directory exists
     settings.LOGS_PATH.mkdir(parents=True, exist_ok=True)
     
-    # Clear existing handlers
+    # Clear existing handlers and stop any previous listener
+    _stop_queue_listener()
     logging.getLogger().handlers.clear()
     
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.setLevel(level)
+    
+    # Root handlers run on a background QueueListener; callers only enqueue records
+    queued_handlers = []
     
     # Console handler with colors
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level))
+    console_handler = BatchedConsoleHandler(sys.stdout)
+    console_handler.setLevel(level)
     console_formatter = ColoredFormatter(
         '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    queued_handlers.append(console_handler)
     
     # File handler for general logs
     general_log_file = settings.LOGS_PATH / 'nine_cycle.log'
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BatchedRotatingFileHandler(
         general_log_file,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
     file_handler.setLevel(logging.INFO)
-    file_formatter = logging.Formatter(
+    file_formatter = CachedTimeFormatter(
         '%(asctime)s | %(levelname)s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    queued_handlers.append(file_handler)
     
     # Error-specific file handler
     error_log_file = settings.LOGS_PATH / 'errors.log'
-    error_handler = logging.handlers.RotatingFileHandler(
+    error_handler = BatchedRotatingFileHandler(
         error_log_file,
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
+        backupCount=5,
+        delay=True  # Opened on the first error
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
-    root_logger.addHandler(error_handler)
+    queued_handlers.append(error_handler)
     
     # Data collection specific log
     data_log_file = settings.LOGS_PATH / 'data_collection.log'
-    data_handler = logging.handlers.RotatingFileHandler(
+    data_handler = BatchedRotatingFileHandler(
         data_log_file,
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=10
+        backupCount=10,
+        delay=True  # Opened on the first data logger record
     )
     data_handler.setLevel(logging.INFO)
     data_handler.setFormatter(file_formatter)
     
-    # Add data handler to specific loggers
+    # Data handler only receives records from the data loggers
     data_loggers = [
         'nine_cycle.collectors',
         'nine_cycle.analyzers',
         'nine_cycle.data_collection'
     ]
-    for logger_name in data_loggers:
-        logger = logging.getLogger(logger_name)
-        logger.addHandler(data_handler)
+    data_handler.addFilter(_LoggerPrefixFilter(data_loggers))
+    queued_handlers.append(data_handler)
     
     # Setup structured logging with structlog
     if enable_structlog and HAS_STRUCTLOG:
@@ -134,46 +464,53 @@ def setup_logging(
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
+                structlog.processors.JSONRenderer(serializer=_orjson_serializer)
+                if HAS_ORJSON else structlog.processors.JSONRenderer()
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-    elif enable_structlog:
-        logger.warning("Structlog not available, skipping structured logging setup")
-    
-    # Setup loguru for additional features
-    if HAS_LOGURU:
-        loguru_logger.remove()  # Remove default handler
-        
-        # Add loguru file handler for analysis logs
-        analysis_log_file = settings.LOGS_PATH / 'analysis.log'
-        loguru_logger.add(
-            analysis_log_file,
-            rotation="100 MB",
-            retention="30 days",
-            level=log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
-            serialize=True
-        )
     
     # Custom log file if specified
     if log_file:
         custom_handler = logging.FileHandler(log_file)
-        custom_handler.setLevel(getattr(logging, log_level))
+        custom_handler.setLevel(level)
         custom_handler.setFormatter(file_formatter)
-        root_logger.addHandler(custom_handler)
+        queued_handlers.append(custom_handler)
+    
+    # Start background listener and route root logging through the queue
+    log_queue = (
+        _BoundedLogQueue(settings.LOG_QUEUE_MAXSIZE) if settings.LOG_QUEUE_MAXSIZE > 0
+        else queue.SimpleQueue()
+    )
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = _BatchingQueueListener(
+        log_queue, *queued_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    
+    if enable_structlog and not HAS_STRUCTLOG:
+        logging.getLogger('nine_cycle.data_collection').warning(
+            "Structlog not available, skipping structured logging setup"
+        )
     
     logging.info(f"Logging configured - Level: {log_level}, Logs directory: {settings.LOGS_PATH}")
 
+def _ensure_logging():
+    """Configure logging with defaults on first use."""
+    if not _CONFIGURED:
+        setup_logging()
+
 def get_logger(name: str) -> logging.Logger:
     """Get a named logger instance."""
+    _ensure_logging()
     return logging.getLogger(name)
 
 def get_structured_logger(name: str):
     """Get a structured logger instance."""
+    _ensure_logging()
     if HAS_STRUCTLOG:
         return structlog.get_logger(name)
     else:
@@ -181,42 +518,59 @@ def get_structured_logger(name: str):
 
 def log_function_call(func):
     """Decorator to log function calls with parameters and execution time."""
+    logger = logging.getLogger(func.__module__)
+    
     def wrapper(*args, **kwargs):
-        logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter()
         
-        # Log function entry
-        logger.debug(f"Entering {func.__name__} with args={args}, kwargs={kwargs}")
+        # Log function entry (skip formatting args unless DEBUG is on)
+        if debug_enabled:
+            logger.debug("Entering %s with args=%s, kwargs=%s", func.__name__, args, kwargs)
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"Completed {func.__name__} in {execution_time:.3f}s")
+            if debug_enabled:
+                execution_time = time.perf_counter() - start_time
+                logger.debug("Completed %s in %.3fs", func.__name__, execution_time)
             return result
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.error(f"Error in {func.__name__} after {execution_time:.3f}s: {str(e)}")
+            execution_time = time.perf_counter() - start_time
+            logger.error("Error in %s after %.3fs: %s", func.__name__, execution_time, e)
             raise
     
     return wrapper
 
+# stdlib loggers behind the event helpers, used for the level check before any work
+_DATA_COLLECTION_LOG = logging.getLogger('nine_cycle.data_collection')
+_ANALYSIS_LOG = logging.getLogger('nine_cycle.analysis')
+
+@functools.lru_cache(maxsize=None)
+def _event_logger(name: str):
+    """Structured logger for the event helpers, created once per name."""
+    return get_structured_logger(name)
+
 def log_data_collection_event(
     source: str,
     event_type: str,
     status: str,
     records_count: int = 0,
     error_message: str = None,
-    metadata: dict = None
+    metadata: dict = None,
+    exc_info: bool = False
 ):
     """Log data collection events with structured information."""
-    logger = get_structured_logger('nine_cycle.data_collection')
+    if not _DATA_COLLECTION_LOG.isEnabledFor(logging.ERROR if status == 'error' else logging.INFO):
+        return
+    
+    logger = _event_logger('nine_cycle.data_collection')
     
     log_data = {
         'source': source,
         'event_type': event_type,
         'status': status,
         'records_count': records_count,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _event_timestamp()
     }
     
     if error_message:
@@ -225,6 +579,9 @@ def log_data_collection_event(
     if metadata:
         log_data['metadata'] = metadata
     
+    if exc_info:
+        log_data['exc_info'] = exc_info
+    
     if status == 'success':
         logger.info("Data collection completed", **log_data)
     elif status == 'error':
@@ -242,7 +599,10 @@ def log_analysis_event(
     metadata: dict = None
 ):
     """Log analysis events with structured information."""
-    logger = get_structured_logger('nine_cycle.analysis')
+    if not _ANALYSIS_LOG.isEnabledFor(logging.INFO):
+        return
+    
+    logger = _event_logger('nine_cycle.analysis')
     
     log_data = {
         'analysis_type': analysis_type,
@@ -250,7 +610,7 @@ def log_analysis_event(
         'input_records': input_records,
         'output_records': output_records,
         'patterns_found': patterns_found,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _event_timestamp()
     }
     
     if confidence_score is not None:
@@ -261,30 +621,43 @@ def log_analysis_event(
     
     logger.info("Analysis event", **log_data)
 
+@functools.lru_cache(maxsize=None)
+def _collection_loggers(source_name: str):
+    """Get the (stdlib, structured) logger pair for a collector source, cached per source."""
+    name = f'nine_cycle.collectors.{source_name}'
+    return get_logger(name), get_structured_logger(name)
+
 class DataCollectionLogger:
     """Specialized logger for data collection activities."""
     
     def __init__(self, source_name: str):
         self.source_name = source_name
-        self.logger = get_logger(f'nine_cycle.collectors.{source_name}')
-        self.structured_logger = get_structured_logger(f'nine_cycle.collectors.{source_name}')
+        self.logger, self.structured_logger = _collection_loggers(source_name)
     
     def start_collection(self, collection_type: str, target_count: int = None):
         """Log start of data collection."""
-        message = f"Starting {collection_type} collection from {self.source_name}"
-        if target_count:
-            message += f" (target: {target_count} records)"
-        
-        self.logger.info(message)
-        log_data_collection_event(
-            source=self.source_name,
-            event_type=collection_type,
-            status='started',
-            metadata={'target_count': target_count}
-        )
+        # With structlog the structured event is the single record; it reaches
+        # the same stdlib handlers through LoggerFactory
+        if HAS_STRUCTLOG:
+            log_data_collection_event(
+                source=self.source_name,
+                event_type=collection_type,
+                status='started',
+                metadata={'target_count': target_count}
+            )
+        elif target_count:
+            self.logger.info(
+                "Starting %s collection from %s (target: %s records)",
+                collection_type, self.source_name, target_count
+            )
+        else:
+            self.logger.info("Starting %s collection from %s", collection_type, self.source_name)
     
     def log_progress(self, collected: int, total: int = None, message: str = None):
         """Log collection progress."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if total:
             percentage = (collected / total) * 100
             progress_msg = f"Progress: {collected}/{total} ({percentage:.1f}%)"
@@ -298,36 +671,39 @@ class DataCollectionLogger:
     
     def log_success(self, collection_type: str, records_collected: int, duration: float = None):
         """Log successful collection completion."""
-        message = f"Completed {collection_type} collection: {records_collected} records"
-        if duration:
-            message += f" in {duration:.2f}s"
-        
-        self.logger.info(message)
-        log_data_collection_event(
-            source=self.source_name,
-            event_type=collection_type,
-            status='success',
-            records_count=records_collected,
-            metadata={'duration_seconds': duration}
-        )
+        if HAS_STRUCTLOG:
+            log_data_collection_event(
+                source=self.source_name,
+                event_type=collection_type,
+                status='success',
+                records_count=records_collected,
+                metadata={'duration_seconds': duration}
+            )
+        elif duration:
+            self.logger.info(
+                "Completed %s collection: %s records in %.2fs",
+                collection_type, records_collected, duration
+            )
+        else:
+            self.logger.info("Completed %s collection: %s records", collection_type, records_collected)
     
     def log_error(self, collection_type: str, error: Exception, records_collected: int = 0):
         """Log collection error."""
-        error_message = f"Error in {collection_type} collection: {str(error)}"
-        self.logger.error(error_message, exc_info=True)
-        log_data_collection_event(
-            source=self.source_name,
-            event_type=collection_type,
-            status='error',
-            records_count=records_collected,
-            error_message=str(error)
-        )
+        if HAS_STRUCTLOG:
+            log_data_collection_event(
+                source=self.source_name,
+                event_type=collection_type,
+                status='error',
+                records_count=records_collected,
+                error_message=str(error),
+                exc_info=True
+            )
+        else:
+            self.logger.error("Error in %s collection: %s", collection_type, error, exc_info=True)
     
     def log_warning(self, message: str, metadata: dict = None):
         """Log warning message."""
-        self.logger.warning(message)
-        if metadata:
+        if metadata and HAS_STRUCTLOG:
             self.structured_logger.warning(message, **metadata)
-
-# Initialize logging on module import
-setup_logging()
+        else:
+            self.logger.warning(message)